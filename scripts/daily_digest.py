@@ -18,10 +18,10 @@ sys.path.insert(0, app_dir)
 
 from src.lib.bitbucket import get_recent_pipelines
 from src.lib.coralogix import handle_get_recent_errors
+from src.lib.utils.config import ENVIRONMENT
 
 # Configuration
 SLACK_CHANNEL = os.environ.get("SLACK_CHANNEL", "#devops")
-ENVIRONMENT = os.environ.get("ENVIRONMENT", "dev")
 
 # Key services to monitor
 KEY_SERVICES = [
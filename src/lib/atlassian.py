@@ -4,18 +4,38 @@ These tools use the Atlassian Admin API v2 for onboarding/offboarding workflows.
 API Reference: https://developer.atlassian.com/cloud/admin/organization/rest/
 """
 
-import os
-import sys
+import copy
+import time
 
 import requests
 
-# Add project root to path to import shared utils
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from src.lib.utils.secrets import get_secret
 
 # Atlassian Admin API base URL
 ATLASSIAN_ADMIN_API = "https://api.atlassian.com"
 
+# Group listings change rarely - cache them (keyed by limit) and drop the cache on any group
+# or membership write. User listings are cached briefly (keyed by limit and cursor) and dropped
+# when a user is suspended, restored, or removed. Entries are (result, stored_at) on the
+# monotonic clock; results are deep-copied in and out so callers can't mutate the cache.
+_groups_cache = {}
+GROUPS_CACHE_TTL_SECONDS = 600  # 10 minutes
+_users_cache = {}
+USERS_CACHE_TTL_SECONDS = 60
+
+
+def _get_cached(cache: dict, key, ttl_seconds: int) -> dict | None:
+    """Get a copy of a cached listing, or None if it is missing or expired."""
+    cached = cache.get(key)
+    if cached and time.monotonic() - cached[1] < ttl_seconds:
+        return copy.deepcopy(cached[0])
+    return None
+
+
+def _set_cached(cache: dict, key, result: dict) -> None:
+    """Cache a copy of a listing."""
+    cache[key] = (copy.deepcopy(result), time.monotonic())
+
 
 def _get_auth_headers() -> dict:
     """Get authentication headers for Atlassian API."""
@@ -93,7 +113,11 @@ def handle_get_directories() -> dict:
 
 
 def handle_list_users(limit: int = 100, cursor: str = None) -> dict:
-    """List users in the organization directory."""
+    """List users in the organization directory (cached)."""
+    cached = _get_cached(_users_cache, (limit, cursor), USERS_CACHE_TTL_SECONDS)
+    if cached is not None:
+        return cached
+
     org_id = _get_org_id()
     directory_id = _get_directory_id()
 
@@ -117,6 +141,7 @@ def handle_list_users(limit: int = 100, cursor: str = None) -> dict:
             )
         result["formatted_users"] = users
         result["count"] = len(users)
+        _set_cached(_users_cache, (limit, cursor), result)
 
     return result
 
@@ -132,6 +157,8 @@ def handle_suspend_user(account_id: str) -> dict:
     if "error" not in result:
         result["message"] = f"User {account_id} suspended successfully"
         result["action"] = "suspend"
+        _users_cache.clear()
+        _groups_cache.clear()  # Group member counts change too
 
     return result
 
@@ -147,6 +174,8 @@ def handle_restore_user(account_id: str) -> dict:
     if "error" not in result:
         result["message"] = f"User {account_id} restored successfully"
         result["action"] = "restore"
+        _users_cache.clear()
+        _groups_cache.clear()  # Group member counts change too
 
     return result
 
@@ -162,6 +191,8 @@ def handle_remove_user(account_id: str) -> dict:
     if "error" not in result:
         result["message"] = f"User {account_id} removed from directory"
         result["action"] = "remove"
+        _users_cache.clear()
+        _groups_cache.clear()  # Group member counts change too
 
     return result
 
@@ -172,7 +203,11 @@ def handle_remove_user(account_id: str) -> dict:
 
 
 def handle_list_groups(limit: int = 100) -> dict:
-    """List all groups in the organization directory."""
+    """List all groups in the organization directory (cached)."""
+    cached = _get_cached(_groups_cache, limit, GROUPS_CACHE_TTL_SECONDS)
+    if cached is not None:
+        return cached
+
     org_id = _get_org_id()
     directory_id = _get_directory_id()
 
@@ -192,6 +227,7 @@ def handle_list_groups(limit: int = 100) -> dict:
             )
         result["formatted_groups"] = groups
         result["count"] = len(groups)
+        _set_cached(_groups_cache, limit, result)
 
     return result
 
@@ -209,6 +245,7 @@ def handle_create_group(name: str, description: str = "") -> dict:
     result = _make_request("POST", endpoint, data)
 
     if "error" not in result:
+        _groups_cache.clear()
         result["message"] = f"Group '{name}' created successfully"
 
     return result
@@ -223,6 +260,7 @@ def handle_delete_group(group_id: str) -> dict:
     result = _make_request("DELETE", endpoint)
 
     if "error" not in result:
+        _groups_cache.clear()
         result["message"] = f"Group {group_id} deleted"
 
     return result
@@ -238,6 +276,7 @@ def handle_add_user_to_group(group_id: str, account_id: str) -> dict:
     result = _make_request("POST", endpoint, data)
 
     if "error" not in result:
+        _groups_cache.clear()
         result["message"] = f"User {account_id} added to group {group_id}"
 
     return result
@@ -252,6 +291,7 @@ def handle_remove_user_from_group(group_id: str, account_id: str) -> dict:
     result = _make_request("DELETE", endpoint)
 
     if "error" not in result:
+        _groups_cache.clear()
         result["message"] = f"User {account_id} removed from group {group_id}"
 
     return result
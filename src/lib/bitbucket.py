@@ -3,14 +3,8 @@
 Provides tools for repository management, PRs, and CI/CD pipelines.
 """
 
-import os
-import sys
-
 import requests
 
-# Add project root to path to import shared utils
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 from src.lib.utils.config import BITBUCKET_WORKSPACE
 from src.lib.utils.secrets import get_secret
 
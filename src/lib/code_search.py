@@ -3,14 +3,8 @@
 Provides semantic search across 254 MrRobot repositories (17,169 documents).
 """
 
-import os
-import sys
-
 import requests
 
-# Add project root to path to import shared utils
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 from src.lib.utils.aws import get_bedrock_agent_runtime
 from src.lib.utils.config import BITBUCKET_EMAIL, BITBUCKET_WORKSPACE, KNOWLEDGE_BASE_ID
 from src.lib.utils.secrets import get_secret
@@ -5,28 +5,25 @@ Falls back to defaults if S3 is unavailable.
 """
 
 import json
-import os
 import time
 from typing import Any
 
 import boto3
 from botocore.exceptions import ClientError
 
+from src.lib.utils.config import CODE_KB_BUCKET
+
 # S3 bucket for configs - environment-aware
-# Format: mrrobot-code-kb-{env}-{account_id}
-_ENVIRONMENT = os.environ.get("ENVIRONMENT", "dev")
-_ACCOUNT_IDS = {
-    "dev": "123456789012",
-    "prod": "246295362269",
-}
-_account_id = _ACCOUNT_IDS.get(_ENVIRONMENT, "123456789012")
-CONFIG_BUCKET = f"mrrobot-code-kb-{_ENVIRONMENT}-{_account_id}"
+CONFIG_BUCKET = CODE_KB_BUCKET
 CONFIG_PREFIX = "clippy-config/"
 
 # Cache settings
 _cache = {}
 CACHE_TTL_SECONDS = 300  # 5 minutes
 
+# Name/alias -> (key, info) index for lookup_service, rebuilt whenever the registry object changes
+_service_index = (None, {})
+
 
 def _get_s3_client():
     """Get S3 client."""
@@ -125,6 +122,29 @@ def get_env_mappings() -> dict:
     return _get_cached("env_mappings", loader, default=DEFAULT_ENV_MAPPINGS)
 
 
+def _get_service_index() -> dict:
+    """Get the lookup index for the current service registry.
+
+    Keys win over full names, and full names/aliases resolve to the first service
+    that declares them (same precedence as a linear scan of the registry).
+    """
+    global _service_index
+    registry = get_service_registry()
+    if _service_index[0] is registry:
+        return _service_index[1]
+
+    index = {key: (key, info) for key, info in registry.items()}
+    for key, info in registry.items():
+        full_name = info.get("full_name", "").lower()
+        if full_name:
+            index.setdefault(full_name, (key, info))
+        for alias in info.get("aliases", []):
+            index.setdefault(alias.lower(), (key, info))
+
+    _service_index = (registry, index)
+    return index
+
+
 def lookup_service(name: str) -> dict | None:
     """Look up a service by name or alias.
 
@@ -135,25 +155,12 @@ def lookup_service(name: str) -> dict | None:
         Service info dict with full_name, type, aliases, tech_stack, description
         or None if not found
     """
-    registry = get_service_registry()
-    name_lower = name.lower().strip()
-
-    # Direct key match
-    if name_lower in registry:
-        return {"key": name_lower, **registry[name_lower]}
-
-    # Search by alias or full_name
-    for key, info in registry.items():
-        # Check full_name
-        if info.get("full_name", "").lower() == name_lower:
-            return {"key": key, **info}
-
-        # Check aliases
-        for alias in info.get("aliases", []):
-            if alias.lower() == name_lower:
-                return {"key": key, **info}
+    match = _get_service_index().get(name.lower().strip())
+    if match is None:
+        return None
 
-    return None
+    key, info = match
+    return {"key": key, **info}
 
 
 def clear_cache():
@@ -3,16 +3,15 @@
 Provides natural language → DataPrime query conversion and execution.
 """
 
+import functools
 import json
-import os
 import re
-import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import requests
 
-# Add project root to path to import shared utils
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from src.lib.utils.http_client import get_http_session
 from src.lib.utils.secrets import get_secret
 
 # Configuration
@@ -48,6 +47,20 @@ ENV_ALTERNATIVES = {
     "-production": "-prod",
 }
 
+# Patterns for natural language parsing (compiled once at import)
+_SERVICE_NAME_RE = re.compile(r"\b([a-z][a-z0-9]*(?:-[a-z0-9]+)+)\b")  # hyphenated names like "cast-core"
+_QUOTED_TERM_RE = re.compile(r'"([^"]+)"')
+_STATUS_CODE_RE = re.compile(r"\b(5\d{2}|4\d{2}|[23]\d{2})\b")
+_UUID_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+_PATH_RE = re.compile(r"(/[\w/]+(?:/\w+)*)")
+
+# Hyphenated phrases that _SERVICE_NAME_RE matches but aren't services
+_NON_SERVICE_TERMS = frozenset(
+    ["in-prod", "in-dev", "in-staging", "for-prod", "for-dev", "hours-back", "time-range", "log-group", "error-rate"]
+)
+# Environment suffixes stripped from extracted service names
+_ENV_SUFFIXES = ("-prod", "-dev", "-staging", "-sandbox", "-development", "-production")
+
 
 def _extract_service_name(query: str) -> str | None:
     """Extract service name from query using Knowledge Base lookup.
@@ -59,31 +72,17 @@ def _extract_service_name(query: str) -> str | None:
     """
     query_lower = query.lower()
 
-    # Remove environment suffixes for matching
-    env_suffixes = ["-prod", "-dev", "-staging", "-sandbox", "-development", "-production"]
-
     # First, try simple regex to extract hyphenated names from the query
     # This catches explicit mentions like "cforce-service" or "cast-core"
-    service_pattern = r"\b([a-z][a-z0-9]*(?:-[a-z0-9]+)+)\b"
-    matches = re.findall(service_pattern, query_lower)
+    matches = _SERVICE_NAME_RE.findall(query_lower)
 
     for match in matches:
         # Skip common non-service patterns
-        if match in [
-            "in-prod",
-            "in-dev",
-            "in-staging",
-            "for-prod",
-            "for-dev",
-            "hours-back",
-            "time-range",
-            "log-group",
-            "error-rate",
-        ]:
+        if match in _NON_SERVICE_TERMS:
             continue
         # Remove environment suffix if present
         service = match
-        for suffix in env_suffixes:
+        for suffix in _ENV_SUFFIXES:
             if service.endswith(suffix):
                 service = service[: -len(suffix)]
                 break
@@ -120,6 +119,16 @@ def natural_language_to_dataprime(query: str, limit: int = 50) -> dict:
     Returns:
         dict with 'dataprime_query' and 'explanation'
     """
+    # Service extraction may fall back to a Knowledge Base search, so it stays outside the cache
+    service = _extract_service_name(query)
+    result = _build_dataprime_query(query, service, limit)
+    # Copy so callers can't mutate the cached result
+    return {**result, "explanation": list(result["explanation"])}
+
+
+@functools.lru_cache(maxsize=512)
+def _build_dataprime_query(query: str, service: str | None, limit: int) -> dict:
+    """Build the DataPrime query for a natural language query (pure, memoized)."""
     query_lower = query.lower()
     filters = []
     explanation = []
@@ -147,20 +156,19 @@ def natural_language_to_dataprime(query: str, limit: int = 50) -> dict:
             environment_detected = env_name
             break
 
-    # 3. Detect service names - extract any hyphenated service name
-    service = _extract_service_name(query)
+    # 3. Service name (extracted by the caller)
     if service:
         filters.append(f"logGroup ~ '{service}'")
         explanation.append(f"Service: {service}")
 
     # 4. Detect specific search terms (quoted strings)
-    quoted_terms = re.findall(r'"([^"]+)"', query)
+    quoted_terms = _QUOTED_TERM_RE.findall(query)
     for term in quoted_terms:
         message_filters.append(f"message ~ '{term}'")
         explanation.append(f"Search term: '{term}'")
 
     # 5. Detect HTTP status codes (e.g., 504, 500, 403, 401, 200)
-    status_codes = re.findall(r"\b(5\d{2}|4\d{2}|[23]\d{2})\b", query)
+    status_codes = _STATUS_CODE_RE.findall(query)
     for code in status_codes:
         message_filters.append(f"message ~ '{code}'")
         explanation.append(f"HTTP status: {code}")
@@ -210,14 +218,13 @@ def natural_language_to_dataprime(query: str, limit: int = 50) -> dict:
             explanation.append(f"Technical term: {term}")
 
     # 7. Detect UUIDs/orgIds in the query
-    uuid_pattern = r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
-    uuids = re.findall(uuid_pattern, query_lower)
+    uuids = _UUID_RE.findall(query_lower)
     for uuid in uuids:
         message_filters.append(f"message ~ '{uuid}'")
         explanation.append(f"UUID/ID: {uuid}")
 
     # 8. Detect specific endpoints/paths
-    path_patterns = re.findall(r"(/[\w/]+(?:/\w+)*)", query)
+    path_patterns = _PATH_RE.findall(query)
     for path in path_patterns:
         if len(path) > 3:  # Avoid matching just "/"
             message_filters.append(f"message ~ '{path}'")
@@ -336,6 +343,7 @@ def execute_natural_language_query(
         "total_results": len(logs),
         "logs": logs[:limit],
         "environment_searched": env,
+        **_request_error(response),
     }
 
 
@@ -387,7 +395,8 @@ def _make_request(query: str, hours_back: int = 4, limit: int = 100) -> dict:
     }
 
     try:
-        response = requests.post(url, headers=actual_headers, json=payload, timeout=30)
+        # Fail fast on an unreachable endpoint; queries themselves may take up to 30s
+        response = get_http_session().post(url, headers=actual_headers, json=payload, timeout=(5, 30))
         print(f"[Coralogix] Response status: {response.status_code}")
         response.raise_for_status()
         results = []
@@ -406,6 +415,11 @@ def _make_request(query: str, hours_back: int = 4, limit: int = 100) -> dict:
         return {"error": f"API request failed: {str(e)}"}
 
 
+def _request_error(response: dict) -> dict:
+    """Top-level {"error": ...} for a failed request, so callers can tell failures from empty results."""
+    return {"error": response["error"]} if "error" in response else {}
+
+
 def _parse_response(response: dict) -> list:
     """Parse Coralogix API response into log entries."""
     if "error" in response:
@@ -534,6 +548,7 @@ def handle_get_recent_errors(
             svc: {"count": len(errs), "recent_errors": errs[:10]}
             for svc, errs in sorted(errors_by_service.items(), key=lambda x: -len(x[1]))
         },
+        **_request_error(response),
     }
 
 
@@ -565,6 +580,7 @@ def handle_get_service_logs(
         "time_range": f"Last {hours_back} hour(s)",
         "total_results": len(logs),
         "logs": logs,
+        **_request_error(response),
     }
 
 
@@ -623,6 +639,7 @@ def handle_search_logs(query: str, hours_back: int = 4, limit: int = 100) -> dic
             "total_results": len(logs),
             "logs": logs[:limit],
             "environment_searched": env_searched,
+            **_request_error(response),
         }
     else:
         # Convert natural language to DataPrime and execute
@@ -644,16 +661,17 @@ def handle_get_service_health(service_name: str = "all", environment: str = "pro
     total_filter_str = " && ".join(total_filters) if total_filters else "true"
     total_query = f"source logs | filter {total_filter_str} | groupby logGroup | count | sort -_count | limit 20"
 
-    total_response = _make_request(total_query, 1, 20)
-    total_logs = _parse_response(total_response)
-
     error_patterns = "message ~ 'ERROR' || message ~ 'Error' || message ~ 'Exception'"
     error_filters = total_filters + [f"({error_patterns})"]
     error_filter_str = " && ".join(error_filters)
     error_query = f"source logs | filter {error_filter_str} | groupby logGroup | count | sort -_count | limit 20"
 
-    error_response = _make_request(error_query, 1, 20)
-    error_logs = _parse_response(error_response)
+    # Total and error counts are independent queries - run them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        total_future = executor.submit(_make_request, total_query, 1, 20)
+        error_future = executor.submit(_make_request, error_query, 1, 20)
+        total_logs = _parse_response(total_future.result())
+        error_logs = _parse_response(error_future.result())
 
     total_counts = {}
     for log in total_logs:
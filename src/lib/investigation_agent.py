@@ -117,13 +117,23 @@ If you can't find evidence IN THE SPECIFIED ENVIRONMENT, say so clearly - don't
 """
 
 
+# Bedrock model (stateless, reused across investigations; each Agent keeps its own history)
+_bedrock_model = None
+
+
+def _get_bedrock_model() -> BedrockModel:
+    """Get or create the shared Bedrock model for investigation agents."""
+    global _bedrock_model
+    if _bedrock_model is None:
+        _bedrock_model = BedrockModel(model_id="us.anthropic.claude-sonnet-4-20250514-v1:0", region_name="us-east-1")
+    return _bedrock_model
+
+
 def create_investigation_agent() -> Agent:
     """Create a Strands agent for deep issue investigation."""
 
-    model = BedrockModel(model_id="us.anthropic.claude-sonnet-4-20250514-v1:0", region_name="us-east-1")
-
     return Agent(
-        model=model,
+        model=_get_bedrock_model(),
         tools=[
             search_logs,
             check_recent_deploys,
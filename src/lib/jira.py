@@ -12,13 +12,9 @@ API Reference: https://developer.atlassian.com/cloud/jira/platform/rest/v3/
 """
 
 import base64
-import os
-import sys
 
 import requests
 
-# Add project root to path to import shared utils
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from src.lib.utils.secrets import get_secret
 
 # Jira site configuration
@@ -6,14 +6,10 @@ Uses PagerDuty REST API v2 with API token authentication.
 API Reference: https://developer.pagerduty.com/api-reference/
 """
 
-import os
-import sys
 from datetime import datetime, timedelta, timezone
 
 import requests
 
-# Add project root to path to import shared utils
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from src.lib.utils.secrets import get_secret
 
 
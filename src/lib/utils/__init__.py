@@ -1,8 +1,17 @@
 """Shared utilities for AWS, config, secrets, and HTTP clients."""
 
 from .aws import get_bedrock_agent_runtime, get_bedrock_runtime, get_s3_client, get_secrets_manager, get_session
-from .config import AWS_PROFILE, AWS_REGION, BITBUCKET_EMAIL, BITBUCKET_WORKSPACE, KNOWLEDGE_BASE_ID, SECRETS_NAME
-from .http_client import APIClient, make_request
+from .config import (
+    AWS_PROFILE,
+    AWS_REGION,
+    BITBUCKET_EMAIL,
+    BITBUCKET_WORKSPACE,
+    CODE_KB_BUCKET,
+    ENVIRONMENT,
+    KNOWLEDGE_BASE_ID,
+    SECRETS_NAME,
+)
+from .http_client import APIClient, get_http_session, make_request
 from .secrets import get_secret
 
 __all__ = [
@@ -13,9 +22,11 @@ __all__ = [
     "get_s3_client",
     "get_secrets_manager",
     # Config
+    "ENVIRONMENT",
     "AWS_REGION",
     "AWS_PROFILE",
     "KNOWLEDGE_BASE_ID",
+    "CODE_KB_BUCKET",
     "BITBUCKET_EMAIL",
     "BITBUCKET_WORKSPACE",
     "SECRETS_NAME",
@@ -23,5 +34,6 @@ __all__ = [
     "get_secret",
     # HTTP client
     "APIClient",
+    "get_http_session",
     "make_request",
 ]
@@ -1,39 +1,75 @@
-"""Shared AWS client factories."""
+"""Shared AWS client factories.
 
-import boto3
-from botocore.config import Config
+boto3/botocore are imported on first use so that importing this module (or
+src.lib.utils) doesn't pay botocore's start-up cost for callers that never touch AWS.
+"""
+
+import copy
+import threading
 
 from .config import AWS_PROFILE, AWS_REGION
 
+# Session and clients are created once per process (boto3 clients are thread-safe;
+# creating them from a shared session is not, hence the lock)
+_session = None
+_clients = {}
+_clients_lock = threading.Lock()
+
+# botocore Config settings per service, applied once when the client is created
+_BEDROCK_RUNTIME_CONFIG = {"connect_timeout": 30, "read_timeout": 60, "retries": {"max_attempts": 2}}
+_BEDROCK_AGENT_RUNTIME_CONFIG = {"connect_timeout": 10, "read_timeout": 25, "retries": {"max_attempts": 1}}
+_SECRETS_MANAGER_CONFIG = {"connect_timeout": 5, "read_timeout": 5, "retries": {"max_attempts": 1}}
+
 
 def get_session():
-    """Get a boto3 session with proper configuration."""
-    if AWS_PROFILE:
-        return boto3.Session(profile_name=AWS_PROFILE, region_name=AWS_REGION)
-    return boto3.Session(region_name=AWS_REGION)
+    """Get a boto3 session with proper configuration (cached)."""
+    global _session
+    if _session is None:
+        import boto3
+
+        if AWS_PROFILE:
+            _session = boto3.Session(profile_name=AWS_PROFILE, region_name=AWS_REGION)
+        else:
+            _session = boto3.Session(region_name=AWS_REGION)
+    return _session
+
+
+def _get_client(service_name: str, config: dict | None = None):
+    """Get a cached client for an AWS service, creating it on first use.
+
+    config holds botocore Config kwargs; the Config is only built when the client is
+    (from a copy, since botocore rewrites the retries dict in place).
+    """
+    client = _clients.get(service_name)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(service_name)
+            if client is None:
+                from botocore.config import Config
+
+                client = get_session().client(service_name, config=Config(**copy.deepcopy(config)) if config else None)
+                _clients[service_name] = client
+    return client
 
 
 def get_bedrock_runtime():
     """Get Bedrock runtime client for model invocation."""
-    config = Config(connect_timeout=30, read_timeout=60, retries={"max_attempts": 2})
-    return get_session().client("bedrock-runtime", config=config)
+    return _get_client("bedrock-runtime", _BEDROCK_RUNTIME_CONFIG)
 
 
 def get_bedrock_agent_runtime():
     """Get Bedrock Agent Runtime client for Knowledge Base queries."""
-    config = Config(connect_timeout=10, read_timeout=25, retries={"max_attempts": 1})
-    return get_session().client("bedrock-agent-runtime", config=config)
+    return _get_client("bedrock-agent-runtime", _BEDROCK_AGENT_RUNTIME_CONFIG)
 
 
 def get_s3_client():
     """Get S3 client."""
-    return get_session().client("s3")
+    return _get_client("s3")
 
 
 def get_secrets_manager():
     """Get Secrets Manager client."""
-    config = Config(connect_timeout=5, read_timeout=5, retries={"max_attempts": 1})
-    return get_session().client("secretsmanager", config=config)
+    return _get_client("secretsmanager", _SECRETS_MANAGER_CONFIG)
 
 
 # CloudWatch removed - use Coralogix for all log analysis
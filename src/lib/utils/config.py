@@ -2,6 +2,9 @@
 
 import os
 
+# Deployment environment (dev, prod)
+ENVIRONMENT = os.environ.get("ENVIRONMENT", "dev")
+
 # AWS Configuration
 AWS_REGION = os.environ.get("AWS_REGION", "us-east-1")
 AWS_PROFILE = os.environ.get("AWS_PROFILE", "")
@@ -9,6 +12,14 @@ AWS_PROFILE = os.environ.get("AWS_PROFILE", "")
 # Bedrock Knowledge Base
 KNOWLEDGE_BASE_ID = os.environ.get("CODE_KB_ID", "SAJJWYFTNG")
 
+# Shared S3 bucket for Clippy config, memory, and feedback
+# Format: mrrobot-code-kb-{env}-{account_id}
+_ACCOUNT_IDS = {
+    "dev": "123456789012",
+    "prod": "246295362269",
+}
+CODE_KB_BUCKET = f"mrrobot-code-kb-{ENVIRONMENT}-{_ACCOUNT_IDS.get(ENVIRONMENT, '123456789012')}"
+
 # Bitbucket Configuration
 # Email is required for new API tokens (not username like old App Passwords)
 # See scripts/README-bitbucket-auth.md for details
@@ -7,6 +7,35 @@ across all external services (Bitbucket, Jira, PagerDuty, Coralogix, etc.)
 import time
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared session (keeps TCP/TLS connections alive across API calls)
+_http_session = None
+
+
+def get_http_session() -> requests.Session:
+    """Get or create the shared HTTP session.
+
+    Connections are pooled per host, and 502-504 responses on idempotent
+    requests are retried with a short backoff. Connection errors are not
+    retried: urllib3 would retry them for POSTs too, multiplying the wait on
+    an unreachable host by the retry count.
+
+    Returns:
+        requests.Session shared by all API helpers
+    """
+    global _http_session
+    if _http_session is None:
+        retry = Retry(
+            total=2, connect=0, read=0, backoff_factor=0.5, status_forcelist=(502, 503, 504), raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retry)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _http_session = session
+    return _http_session
 
 
 class APIClient:
@@ -122,7 +151,7 @@ class APIClient:
         start = time.time()
 
         try:
-            response = requests.request(
+            response = get_http_session().request(
                 method=method,
                 url=url,
                 params=params,
@@ -206,7 +235,7 @@ def make_request(
     start = time.time()
 
     try:
-        response = requests.request(
+        response = get_http_session().request(
             method=method,
             url=url,
             headers=headers,
@@ -6,6 +6,8 @@ Falls back to environment variables when Secrets Manager is unavailable.
 
 import json
 import os
+import threading
+import time
 
 from .config import SECRETS_NAME
 
@@ -17,32 +19,47 @@ try:
 except ImportError:
     pass  # python-dotenv not installed, skip
 
-# Cache for secrets
+# Cache for secrets: (secrets, expires_at) on the time.monotonic() clock
 _secrets_cache = None
+_secrets_lock = threading.Lock()
+SECRETS_CACHE_TTL_SECONDS = 3600  # 1 hour - picks up rotated secrets
+SECRETS_FAILURE_TTL_SECONDS = 30  # Wait before retrying a failed fetch
 
 
 def get_secrets() -> dict:
     """Fetch secrets from AWS Secrets Manager with caching.
 
+    Failures are cached briefly too, so callers don't hit Secrets Manager on every
+    lookup while it's unreachable. The last good secrets are served during that time.
+
     Returns:
         dict: All secrets from Secrets Manager, or empty dict on failure.
     """
     global _secrets_cache
 
-    if _secrets_cache is not None:
-        return _secrets_cache
-
-    try:
-        from .aws import get_secrets_manager
-
-        client = get_secrets_manager()
-        response = client.get_secret_value(SecretId=SECRETS_NAME)
-        _secrets_cache = json.loads(response["SecretString"])
-        print(f"[Secrets] Loaded from {SECRETS_NAME}")
-        return _secrets_cache
-    except Exception as e:
-        print(f"[Secrets] Warning: Could not fetch from Secrets Manager: {e}")
-        return {}
+    cached = _secrets_cache
+    if cached is not None and time.monotonic() < cached[1]:
+        return cached[0]
+
+    with _secrets_lock:
+        # Another thread may have refreshed the cache while we waited
+        if _secrets_cache is not None and time.monotonic() < _secrets_cache[1]:
+            return _secrets_cache[0]
+
+        try:
+            from .aws import get_secrets_manager
+
+            client = get_secrets_manager()
+            response = client.get_secret_value(SecretId=SECRETS_NAME)
+            secrets = json.loads(response["SecretString"])
+            _secrets_cache = (secrets, time.monotonic() + SECRETS_CACHE_TTL_SECONDS)
+            print(f"[Secrets] Loaded from {SECRETS_NAME}")
+        except Exception as e:
+            print(f"[Secrets] Warning: Could not fetch from Secrets Manager: {e}")
+            last_good = _secrets_cache[0] if _secrets_cache is not None else {}
+            _secrets_cache = (last_good, time.monotonic() + SECRETS_FAILURE_TTL_SECONDS)
+
+        return _secrets_cache[0]
 
 
 def get_secret(key: str, default: str = "") -> str:
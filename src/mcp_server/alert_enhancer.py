@@ -10,12 +10,8 @@ The investigation agent uses Claude Sonnet to autonomously gather evidence,
 correlate patterns, and provide actionable insights.
 """
 
-import os
 import re
-import sys
-
-# Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from concurrent.futures import ThreadPoolExecutor
 
 from src.lib.code_search import search_knowledge_base
 from src.lib.config_loader import lookup_service
@@ -99,24 +95,25 @@ def enhance_alert(alarm_data: dict) -> dict:
         description = ". ".join(description_parts)
 
         # 3. Try the investigation agent (Claude-powered autonomous investigation)
+        # 4. Search codebase for relevant files (fast KB lookup) while the agent runs
         investigation_result = None
         report = ""
-        try:
-            print(f"[AlertEnhancer] Running investigation agent for {service_name} in {environment}...")
-            investigation_result = investigate_issue(
-                service=service_name,
-                environment=environment,
-                description=description,
-                max_steps=8,  # Limit steps for faster response
-            )
-            report = investigation_result.get("report", "")
-            print(f"[AlertEnhancer] Investigation complete. Report length: {len(report)} chars")
-        except Exception as agent_error:
-            print(f"[AlertEnhancer] Investigation agent failed: {agent_error}")
-            # Continue with fallback analysis
-
-        # 4. Search codebase for relevant files (fast KB lookup)
-        code_results = _search_relevant_code(service_name, error_code, alarm_name)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            code_future = executor.submit(_search_relevant_code, service_name, error_code, alarm_name)
+            try:
+                print(f"[AlertEnhancer] Running investigation agent for {service_name} in {environment}...")
+                investigation_result = investigate_issue(
+                    service=service_name,
+                    environment=environment,
+                    description=description,
+                    max_steps=8,  # Limit steps for faster response
+                )
+                report = investigation_result.get("report", "")
+                print(f"[AlertEnhancer] Investigation complete. Report length: {len(report)} chars")
+            except Exception as agent_error:
+                print(f"[AlertEnhancer] Investigation agent failed: {agent_error}")
+                # Continue with fallback analysis
+            code_results = code_future.result()
 
         # 5. If investigation agent succeeded and returned a good report, parse it
         # Otherwise fall back to rule-based analysis
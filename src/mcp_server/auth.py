@@ -9,7 +9,6 @@ import hashlib
 import json
 import os
 import secrets
-import sys
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from urllib.parse import urlencode
@@ -20,8 +19,7 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse, RedirectResponse
 
-# Add project root to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from src.lib.utils.config import ENVIRONMENT
 from src.lib.utils.secrets import get_secret
 
 # Configuration - redirect URIs per environment
@@ -55,8 +53,7 @@ def _get_dynamodb_client():
 
 def _get_oauth_state_table() -> str:
     """Get the DynamoDB table name for OAuth state."""
-    env = os.environ.get("ENVIRONMENT", "dev")
-    return f"mrrobot-ai-feedback-{env}"
+    return f"mrrobot-ai-feedback-{ENVIRONMENT}"
 
 
 def _store_oauth_state(state_hash: str, data: dict) -> None:
@@ -185,7 +182,7 @@ def get_redirect_uri() -> str:
     if os.environ.get("LOCAL_DEV") or os.environ.get("VITE_API_URL"):
         return REDIRECT_URIS["local"]
     # Check for prod environment
-    if os.environ.get("ENVIRONMENT") == "prod":
+    if ENVIRONMENT == "prod":
         return REDIRECT_URIS["prod"]
     return REDIRECT_URIS["dev"]
 
@@ -6,26 +6,23 @@ Reuses the same tools as the Slack bot but streams responses via WebSocket.
 
 import asyncio
 import json
-import os
-import sys
 import time
+from collections import deque
 
 from starlette.websockets import WebSocket, WebSocketDisconnect
 
-# Add project root to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 from src.lib.config_loader import get_system_prompt
 from src.mcp_server.clippy_tools import CLIPPY_TOOLS
 from src.mcp_server.slack_bot.bedrock_client import get_bedrock_client
 from src.mcp_server.slack_bot.memory import add_context_from_memory
 from src.mcp_server.slack_bot.prompt_enhancer import enhance_prompt
-from src.mcp_server.slack_bot.tool_executor import execute_tool
+from src.mcp_server.slack_bot.tool_executor import execute_tool, serialize_tool_result
 
 # Model configuration
 MODEL_ID = "us.anthropic.claude-sonnet-4-20250514-v1:0"
 MAX_TOKENS = 4096
 MAX_TOOL_CALLS = 10
+MAX_SESSION_MESSAGES = 50  # Older turns are dropped; only the most recent ones are sent to Claude
 
 
 class ChatSession:
@@ -34,7 +31,7 @@ class ChatSession:
     def __init__(self, user_id: str = None, user_email: str = None):
         self.user_id = user_id
         self.user_email = user_email
-        self.messages = []  # Claude API message format
+        self.messages = deque(maxlen=MAX_SESSION_MESSAGES)  # Claude API message format
         self.created_at = time.time()
 
     def add_user_message(self, content: str):
@@ -66,7 +63,7 @@ class ChatSession:
 
     def get_messages(self, limit: int = 20) -> list:
         """Get recent messages for context."""
-        return self.messages[-limit:]
+        return list(self.messages)[-limit:]
 
 
 # Active sessions (in production, use Redis)
@@ -264,7 +261,7 @@ async def stream_claude_response(websocket: WebSocket, session: ChatSession, sys
                 tool_result = await loop.run_in_executor(None, lambda: execute_tool(tool_name, tool_input))
 
                 # Compact result to avoid token overflow
-                result_str = json.dumps(tool_result, default=str)
+                result_str = serialize_tool_result(tool_result)
                 if len(result_str) > 8000:
                     result_str = result_str[:8000] + "... (truncated)"
 
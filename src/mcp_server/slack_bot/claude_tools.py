@@ -14,7 +14,7 @@ from src.mcp_server.slack_bot.bedrock_client import get_bedrock_client
 from src.mcp_server.slack_bot.memory import add_context_from_memory
 from src.mcp_server.slack_bot.metrics import get_metrics
 from src.mcp_server.slack_bot.prompt_enhancer import enhance_prompt
-from src.mcp_server.slack_bot.tool_executor import execute_tool
+from src.mcp_server.slack_bot.tool_executor import execute_tool, serialize_tool_result
 
 
 def invoke_claude_with_tools(
@@ -176,7 +176,7 @@ def invoke_claude_with_tools(
                 tool_results.append(tool_result)
 
                 # Serialize tool result and check if truncation needed
-                tool_result_str = json.dumps(tool_result, default=str)
+                tool_result_str = serialize_tool_result(tool_result)
                 was_truncated = len(tool_result_str) > 8000
                 if was_truncated:
                     any_truncated = True
@@ -5,17 +5,15 @@ Stores feedback in S3 for later analysis.
 """
 
 import json
-import os
 from datetime import datetime
 
 import boto3
 from botocore.exceptions import ClientError
 
+from src.lib.utils.config import CODE_KB_BUCKET
+
 # S3 bucket for feedback storage - environment-aware
-_ENVIRONMENT = os.environ.get("ENVIRONMENT", "dev")
-_ACCOUNT_IDS = {"dev": "123456789012", "prod": "246295362269"}
-_account_id = _ACCOUNT_IDS.get(_ENVIRONMENT, "123456789012")
-FEEDBACK_BUCKET = f"mrrobot-code-kb-{_ENVIRONMENT}-{_account_id}"
+FEEDBACK_BUCKET = CODE_KB_BUCKET
 FEEDBACK_PREFIX = "clippy-feedback/"
 
 # In-memory cache of recent messages for feedback correlation
@@ -23,10 +21,16 @@ FEEDBACK_PREFIX = "clippy-feedback/"
 _recent_messages = {}
 MAX_CACHED_MESSAGES = 500
 
+# S3 client (reused across feedback writes)
+_s3_client = None
+
 
 def _get_s3_client():
-    """Get S3 client."""
-    return boto3.client("s3", region_name="us-east-1")
+    """Get or create S3 client."""
+    global _s3_client
+    if _s3_client is None:
+        _s3_client = boto3.client("s3", region_name="us-east-1")
+    return _s3_client
 
 
 def store_message_for_feedback(
@@ -5,18 +5,16 @@ Helps Clippy learn from past issues to provide better responses.
 """
 
 import json
-import os
 import time
 from datetime import datetime, timedelta
 
 import boto3
 from botocore.exceptions import ClientError
 
+from src.lib.utils.config import CODE_KB_BUCKET
+
 # S3 bucket for memory storage - environment-aware
-_ENVIRONMENT = os.environ.get("ENVIRONMENT", "dev")
-_ACCOUNT_IDS = {"dev": "123456789012", "prod": "246295362269"}
-_account_id = _ACCOUNT_IDS.get(_ENVIRONMENT, "123456789012")
-MEMORY_BUCKET = f"mrrobot-code-kb-{_ENVIRONMENT}-{_account_id}"
+MEMORY_BUCKET = CODE_KB_BUCKET
 MEMORY_PREFIX = "clippy-memory/"
 
 # In-memory cache with TTL
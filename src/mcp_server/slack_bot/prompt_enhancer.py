@@ -50,15 +50,14 @@ def _build_service_context(registry: dict, limit: int = 30) -> str:
     services.sort(key=lambda x: (-x["priority"], x["key"]))
 
     # Build context string
-    lines = []
-    for svc in services[:limit]:
-        aliases_str = ", ".join(svc["aliases"][:5]) if svc["aliases"] else ""
-        if aliases_str:
-            lines.append(f"- {svc['full_name']} (aliases: {aliases_str})")
-        else:
-            lines.append(f"- {svc['full_name']}")
-
-    return "\n".join(lines)
+    return "\n".join(
+        (
+            f"- {svc['full_name']} (aliases: {', '.join(svc['aliases'][:5])})"
+            if svc["aliases"]
+            else f"- {svc['full_name']}"
+        )
+        for svc in services[:limit]
+    )
 
 
 def _detect_suspicious_request(message: str) -> dict | None:
@@ -3,8 +3,31 @@
 Handles executing MCP tools and compacting results to reduce token usage.
 """
 
+import copy
+import json
+import threading
+import time
+
 from src.mcp_server.slack_bot.alerting import alert_error
 
+# Short-lived cache of tool results keyed on (tool_name, tool_input).
+# Repeat calls within a conversation (or from several users asking the same
+# question) are served from memory instead of re-querying the backend.
+# Only slow-changing lookups are cached - live state (logs, pipelines, PRs,
+# incidents) must always be fetched fresh.
+_RESULT_CACHE_TTL_SECONDS = 60
+_RESULT_CACHE_MAX_ENTRIES = 256
+_CACHED_TOOLS = {
+    "search_code",
+    "search_devops_history",
+    "get_service_info",
+    "jira_get_ticket",
+    "get_confluence_page",
+    "list_confluence_spaces",
+}
+_result_cache = {}  # key -> (expires_at, result); results are deep-copied in and out
+_result_cache_lock = threading.Lock()
+
 
 def _summarize_logs(logs: list, max_logs: int = 20) -> list:
     """Summarize log entries to reduce token usage.
@@ -13,83 +36,121 @@ def _summarize_logs(logs: list, max_logs: int = 20) -> list:
     """
     summarized = []
     for log in logs[:max_logs]:
-        entry = {
-            "timestamp": log.get("timestamp", log.get("@timestamp", "")),
-            "level": log.get("level", log.get("severity", "")),
-            "service": log.get("logGroup", log.get("service", ""))[-50:],  # Last 50 chars
-        }
-        # Get message and truncate
-        msg = log.get("message", log.get("msg", str(log)))
+        # Get message (only stringify the whole entry when there is no message field)
+        if "message" in log:
+            msg = log["message"]
+        elif "msg" in log:
+            msg = log["msg"]
+        else:
+            msg = str(log)
         if isinstance(msg, str):
-            entry["message"] = msg[:500] + "..." if len(msg) > 500 else msg
+            msg = msg[:500] + "..." if len(msg) > 500 else msg
         else:
-            entry["message"] = str(msg)[:500]
-        summarized.append(entry)
+            msg = str(msg)[:500]
+        summarized.append(
+            {
+                "timestamp": log.get("timestamp", log.get("@timestamp", "")),
+                "level": log.get("level", log.get("severity", "")),
+                "service": log.get("logGroup", log.get("service", ""))[-50:],  # Last 50 chars
+                "message": msg,
+            }
+        )
     return summarized
 
 
+def _compact_log_results(result: dict) -> dict:
+    """Summarize log results (search_logs, get_recent_errors)."""
+    if "logs" in result:
+        result["logs"] = _summarize_logs(result["logs"], max_logs=15)
+        result["_compacted"] = True
+    if "errors_by_service" in result:
+        # Keep only top 5 services, 5 errors each
+        errors_by_service = result["errors_by_service"]
+        compacted = {}
+        for svc, data in list(errors_by_service.items())[:5]:
+            if isinstance(data, dict) and "recent_errors" in data:
+                data["recent_errors"] = _summarize_logs(data["recent_errors"], max_logs=5)
+            compacted[svc] = data
+        result["errors_by_service"] = compacted
+        result["_compacted"] = True
+    return result
+
+
+def _compact_code_results(result: dict) -> dict:
+    """Truncate code snippets (search_code)."""
+    if "results" in result:
+        for r in result["results"]:
+            if "content" in r and len(r["content"]) > 800:
+                r["content"] = r["content"][:800] + "\n... [truncated]"
+        result["_compacted"] = True
+    return result
+
+
+def _compact_history_results(result: dict) -> dict:
+    """Summarize Slack history results (search_devops_history)."""
+    if "results" in result:
+        for r in result["results"]:
+            if "content" in r and len(r["content"]) > 600:
+                r["content"] = r["content"][:600] + "... [more context available]"
+        result["_compacted"] = True
+    return result
+
+
+def _compact_pr_details(result: dict) -> dict:
+    """Limit files shown and truncate descriptions (get_pr_details)."""
+    if "files_changed" in result and len(result["files_changed"]) > 10:
+        result["files_changed"] = result["files_changed"][:10]
+        result["more_files"] = True
+    if "description" in result and len(result["description"]) > 500:
+        result["description"] = result["description"][:500] + "..."
+    # Keep comments summary but truncate individual comments
+    if "comments" in result:
+        comments = result["comments"] or []
+        kept = comments[:5]
+        for c in kept:
+            if "content" in c and len(c["content"]) > 200:
+                c["content"] = c["content"][:200] + "..."
+        if len(comments) > 5:
+            result["comments"] = kept
+            result["more_comments"] = True
+    return result
+
+
+def _compact_investigation(result: dict) -> dict:
+    """Keep key report sections, summarize details (investigate_issue)."""
+    if "logs" in result:
+        result["logs"] = _summarize_logs(result["logs"], max_logs=10)
+    if "recent_deploys" in result and len(result["recent_deploys"]) > 3:
+        result["recent_deploys"] = result["recent_deploys"][:3]
+    return result
+
+
+# Per-tool compaction, resolved with a single dict lookup instead of an if/elif chain
+_COMPACTORS = {
+    "search_logs": _compact_log_results,
+    "get_recent_errors": _compact_log_results,
+    "search_code": _compact_code_results,
+    "search_devops_history": _compact_history_results,
+    "get_pr_details": _compact_pr_details,
+    "investigate_issue": _compact_investigation,
+}
+
+
 def _compact_tool_result(tool_name: str, result: dict) -> dict:
     """Compact tool results to reduce size while preserving key information.
 
     This is critical for preventing truncation when sending results to Claude.
     Each tool type gets specific compaction logic to preserve the most useful info.
     """
-    if tool_name in ["search_logs", "get_recent_errors"]:
-        # Summarize log results
-        if "logs" in result:
-            result["logs"] = _summarize_logs(result["logs"], max_logs=15)
-            result["_compacted"] = True
-        if "errors_by_service" in result:
-            # Keep only top 5 services, 5 errors each
-            errors_by_service = result["errors_by_service"]
-            compacted = {}
-            for svc, data in list(errors_by_service.items())[:5]:
-                if isinstance(data, dict) and "recent_errors" in data:
-                    data["recent_errors"] = _summarize_logs(data["recent_errors"], max_logs=5)
-                compacted[svc] = data
-            result["errors_by_service"] = compacted
-            result["_compacted"] = True
-
-    elif tool_name == "search_code":
-        # Truncate code snippets
-        if "results" in result:
-            for r in result["results"]:
-                if "content" in r and len(r["content"]) > 800:
-                    r["content"] = r["content"][:800] + "\n... [truncated]"
-            result["_compacted"] = True
-
-    elif tool_name == "search_devops_history":
-        # Summarize Slack history results
-        if "results" in result:
-            for r in result["results"]:
-                if "content" in r and len(r["content"]) > 600:
-                    r["content"] = r["content"][:600] + "... [more context available]"
-            result["_compacted"] = True
-
-    elif tool_name == "get_pr_details":
-        # Limit files shown and truncate descriptions
-        if "files_changed" in result and len(result["files_changed"]) > 10:
-            result["files_changed"] = result["files_changed"][:10]
-            result["more_files"] = True
-        if "description" in result and len(result["description"]) > 500:
-            result["description"] = result["description"][:500] + "..."
-        # Keep comments summary but truncate individual comments
-        if "comments" in result:
-            for c in result.get("comments", [])[:5]:
-                if "content" in c and len(c["content"]) > 200:
-                    c["content"] = c["content"][:200] + "..."
-            if len(result["comments"]) > 5:
-                result["comments"] = result["comments"][:5]
-                result["more_comments"] = True
-
-    elif tool_name == "investigate_issue":
-        # This returns a full report - keep key sections, summarize details
-        if "logs" in result:
-            result["logs"] = _summarize_logs(result["logs"], max_logs=10)
-        if "recent_deploys" in result and len(result["recent_deploys"]) > 3:
-            result["recent_deploys"] = result["recent_deploys"][:3]
+    compactor = _COMPACTORS.get(tool_name)
+    if compactor is None:
+        return result
+    return compactor(result)
 
-    return result
+
+def serialize_tool_result(result) -> str:
+    """Serialize a tool result for Claude as compact JSON (no whitespace padding, raw unicode)."""
+    return json.dumps(result, separators=(",", ":"), ensure_ascii=False, default=str)
 
 
 def execute_tool(tool_name: str, tool_input: dict) -> dict:
@@ -98,12 +159,29 @@ def execute_tool(tool_name: str, tool_input: dict) -> dict:
     This maps Claude's tool calls to our actual MCP tool implementations.
     Results are compacted to reduce token usage.
     """
+    cache_key = None
+    if tool_name in _CACHED_TOOLS:
+        cache_key = (tool_name, json.dumps(tool_input, sort_keys=True, default=str))
+        with _result_cache_lock:
+            cached = _result_cache.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            print(f"[Clippy] Tool cache hit: {tool_name}")
+            return copy.deepcopy(cached[1])
+
     result = _execute_tool_internal(tool_name, tool_input)
 
     # Compact results to reduce size (prevents truncation)
     if isinstance(result, dict) and "error" not in result:
         result = _compact_tool_result(tool_name, result)
 
+        # Only successful results are cached
+        if cache_key is not None:
+            with _result_cache_lock:
+                if len(_result_cache) >= _RESULT_CACHE_MAX_ENTRIES:
+                    # Drop the oldest entry (dicts preserve insertion order)
+                    _result_cache.pop(next(iter(_result_cache)))
+                _result_cache[cache_key] = (time.monotonic() + _RESULT_CACHE_TTL_SECONDS, copy.deepcopy(result))
+
     return result
 
 
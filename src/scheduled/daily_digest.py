@@ -5,9 +5,11 @@ Runs as a scheduled ECS task via EventBridge.
 Gathers health info from key services and posts to #devops channel.
 """
 
+import heapq
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 # Force unbuffered output for CloudWatch Logs
@@ -18,14 +20,15 @@ import boto3
 
 # Add app directory to path for imports (works in Docker where WORKDIR=/app)
 app_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-sys.path.insert(0, app_dir)
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
 
 from src.lib.bitbucket import get_pipeline_status
 from src.lib.coralogix import handle_get_recent_errors
+from src.lib.utils.config import ENVIRONMENT
 
 # Configuration
 SLACK_CHANNEL = os.environ.get("SLACK_CHANNEL", "#clippy-ai-dev")
-ENVIRONMENT = os.environ.get("ENVIRONMENT", "dev")
 
 # Key services to monitor (service name -> Bitbucket repo name)
 KEY_SERVICES = {
@@ -43,6 +46,9 @@ KEY_SERVICES = {
 # Cache for Slack token (fetched at startup to avoid clock skew issues)
 _slack_token_cache = None
 
+# Cache for Slack client (reused across posts so the HTTP connection stays alive)
+_slack_client_cache = None
+
 
 def get_slack_token():
     """Get Slack token from secrets (cached)."""
@@ -67,18 +73,29 @@ def get_slack_token():
         return None
 
 
-def post_to_slack(message: str, blocks: list = None):
-    """Post message to Slack channel."""
-    slack_token = get_slack_token()
+def get_slack_client():
+    """Get Slack WebClient (cached)."""
+    global _slack_client_cache
+    if _slack_client_cache is not None:
+        return _slack_client_cache
 
+    slack_token = get_slack_token()
     if not slack_token:
-        print("[Digest] No Slack token available")
-        return False
+        return None
 
-    try:
-        from slack_sdk import WebClient
+    from slack_sdk import WebClient
+
+    _slack_client_cache = WebClient(token=slack_token)
+    return _slack_client_cache
 
-        client = WebClient(token=slack_token)
+
+def post_to_slack(message: str, blocks: list = None):
+    """Post message to Slack channel."""
+    try:
+        client = get_slack_client()
+        if client is None:
+            print("[Digest] No Slack token available")
+            return False
 
         result = client.chat_postMessage(
             channel=SLACK_CHANNEL,
@@ -147,71 +164,89 @@ def _get_error_count(service: str, environment: str, hours_back: int) -> int:
         return 0
 
 
+def _get_service_errors(service: str) -> dict | None:
+    """Get error count and sample messages for one service in the last 24 hours."""
+    try:
+        # Get actual count using count aggregation
+        error_count = _get_error_count(service, "prod", 24)
+        print(f"[Digest] {service}: {error_count} errors")
+
+        if error_count > 0:
+            # Get sample errors for display (limit to 10)
+            result = handle_get_recent_errors(
+                service_name=service,
+                environment="prod",
+                hours_back=24,
+                limit=10,
+            )
+
+            # Extract sample error messages
+            top_errors = []
+            for svc_name, svc_data in result.get("errors_by_service", {}).items():
+                for err in svc_data.get("recent_errors", [])[:5]:
+                    msg = err.get("message", "")[:200]
+                    top_errors.append(msg)
+
+            return {
+                "count": error_count,
+                "top_errors": top_errors[:5],
+            }
+    except Exception as e:
+        print(f"[Digest] Error getting errors for {service}: {e}")
+    return None
+
+
 def get_error_summary() -> dict:
     """Get error summary for key services in the last 24 hours."""
     errors_by_service = {}
 
-    for service in KEY_SERVICES:
-        try:
-            # Get actual count using count aggregation
-            error_count = _get_error_count(service, "prod", 24)
-            print(f"[Digest] {service}: {error_count} errors")
-
-            if error_count > 0:
-                # Get sample errors for display (limit to 10)
-                result = handle_get_recent_errors(
-                    service_name=service,
-                    environment="prod",
-                    hours_back=24,
-                    limit=10,
-                )
-
-                # Extract sample error messages
-                top_errors = []
-                for svc_name, svc_data in result.get("errors_by_service", {}).items():
-                    for err in svc_data.get("recent_errors", [])[:5]:
-                        msg = err.get("message", "")[:200]
-                        top_errors.append(msg)
-
-                errors_by_service[service] = {
-                    "count": error_count,
-                    "top_errors": top_errors[:5],
-                }
-        except Exception as e:
-            print(f"[Digest] Error getting errors for {service}: {e}")
+    # Services are independent Coralogix queries - run them concurrently
+    with ThreadPoolExecutor(max_workers=len(KEY_SERVICES)) as executor:
+        for service, summary in zip(KEY_SERVICES, executor.map(_get_service_errors, KEY_SERVICES)):
+            if summary:
+                errors_by_service[service] = summary
 
     return errors_by_service
 
 
+def _get_service_deployments(service: str, repo_name: str) -> list:
+    """Get successful deployments for one service in the last 24 hours."""
+    deployments = []
+    try:
+        result = get_pipeline_status(repo_name, limit=5)
+
+        # Filter to last 24 hours and successful deployments
+        cutoff = datetime.utcnow() - timedelta(hours=24)
+        for pipeline in result.get("pipelines", []):
+            created = pipeline.get("created_on", "")
+            if created:
+                try:
+                    pipeline_time = datetime.fromisoformat(created.replace("Z", "+00:00"))
+                    if pipeline_time.replace(tzinfo=None) > cutoff:
+                        if pipeline.get("state", {}).get("result", {}).get("name") == "SUCCESSFUL":
+                            deployments.append(
+                                {
+                                    "service": service,
+                                    "commit": pipeline.get("target", {}).get("commit", {}).get("message", "")[:50],
+                                    "author": pipeline.get("creator", {}).get("display_name", "Unknown"),
+                                    "time": created,
+                                }
+                            )
+                except Exception:
+                    pass
+    except Exception as e:
+        print(f"[Digest] Error getting deployments for {service}: {e}")
+    return deployments
+
+
 def get_deployment_summary() -> list:
     """Get recent deployments in the last 24 hours."""
     deployments = []
 
-    for service, repo_name in KEY_SERVICES.items():
-        try:
-            result = get_pipeline_status(repo_name, limit=5)
-
-            # Filter to last 24 hours and successful deployments
-            cutoff = datetime.utcnow() - timedelta(hours=24)
-            for pipeline in result.get("pipelines", []):
-                created = pipeline.get("created_on", "")
-                if created:
-                    try:
-                        pipeline_time = datetime.fromisoformat(created.replace("Z", "+00:00"))
-                        if pipeline_time.replace(tzinfo=None) > cutoff:
-                            if pipeline.get("state", {}).get("result", {}).get("name") == "SUCCESSFUL":
-                                deployments.append(
-                                    {
-                                        "service": service,
-                                        "commit": pipeline.get("target", {}).get("commit", {}).get("message", "")[:50],
-                                        "author": pipeline.get("creator", {}).get("display_name", "Unknown"),
-                                        "time": created,
-                                    }
-                                )
-                    except Exception:
-                        pass
-        except Exception as e:
-            print(f"[Digest] Error getting deployments for {service}: {e}")
+    # Repos are independent Bitbucket calls - run them concurrently
+    with ThreadPoolExecutor(max_workers=len(KEY_SERVICES)) as executor:
+        for service_deployments in executor.map(_get_service_deployments, KEY_SERVICES.keys(), KEY_SERVICES.values()):
+            deployments.extend(service_deployments)
 
     return deployments[:10]  # Limit to 10 most recent
 
@@ -248,7 +283,7 @@ def format_digest() -> tuple[str, list]:
         )
 
         # Show each service with errors and sample error messages
-        for service, data in sorted(errors.items(), key=lambda x: -x[1]["count"])[:5]:
+        for service, data in heapq.nlargest(5, errors.items(), key=lambda x: x[1]["count"]):
             service_short = service.replace("mrrobot-", "")
             error_text = f"*{service_short}*: {data['count']} errors"
 
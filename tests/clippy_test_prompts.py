@@ -15,6 +15,9 @@ Usage:
 import json
 import os
 import sys
+import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Add project root to path
@@ -100,6 +103,15 @@ TEST_PROMPTS = {
     ],
 }
 
+# Simulated thread history is capped at the last N messages (2 per turn)
+MAX_THREAD_CONTEXT = 20
+MAX_THREAD_CONTEXT_CHARS = 12000  # ~3000 tokens
+
+# (category, name, prompt) rows, flattened once for the runners
+_FLAT_PROMPTS = tuple(
+    (category, name, prompt) for category, prompts in TEST_PROMPTS.items() for name, prompt in prompts
+)
+
 
 class TestMetrics:
     """Track metrics across test runs."""
@@ -155,99 +167,126 @@ class TestMetrics:
         return "\n".join(lines)
 
 
-def run_tests(categories=None, verbose=True, save_results=False):
+def _run_prompt(category: str, name: str, prompt: str, verbose: bool = True, label: str = None) -> tuple[dict, str]:
+    """Run one test prompt and return its result record plus the formatted output block.
+
+    Output is buffered into one string so each test is a single write and parallel runs don't interleave.
+    """
+    from src.mcp_server.slack_bot import invoke_claude_with_tools
+
+    lines = [
+        f"\n[{label or category}] {name}",
+        f"PROMPT: {prompt[:70]}{'...' if len(prompt) > 70 else ''}",
+        "-" * 60,
+    ]
+
+    try:
+        result = invoke_claude_with_tools(prompt)
+        tool = result.get("tool_used") or "respond_directly"
+        all_tools = result.get("all_tools_used", [])
+        response = result.get("response", "No response")
+
+        # Check for truncation warning in response
+        was_truncated = "truncated" in response.lower() or result.get("was_truncated")
+        hit_limit = "need more information" in response.lower()
+
+        lines.append(f"TOOL: {tool}")
+        if len(all_tools) > 1:
+            lines.append(f"ALL TOOLS: {' -> '.join(all_tools)}")
+
+        if was_truncated:
+            lines.append("WARNING: Results were truncated")
+        if hit_limit:
+            lines.append("WARNING: Hit max tool call limit")
+
+        if verbose:
+            lines.append(f"\nRESPONSE:\n{response[:600]}")
+            if len(response) > 600:
+                lines.append(f"... [{len(response) - 600} more chars]")
+
+        result_record = {
+            "category": category,
+            "name": name,
+            "prompt": prompt,
+            "tool_used": tool,
+            "all_tools_used": all_tools,
+            "response": response,
+            "was_truncated": was_truncated,
+            "hit_tool_limit": hit_limit,
+            "success": "error" not in response.lower() and "encountered an error" not in response.lower(),
+        }
+
+    except Exception as e:
+        lines.append(f"ERROR: {e}")
+        lines.append(traceback.format_exc())
+
+        result_record = {
+            "category": category,
+            "name": name,
+            "prompt": prompt,
+            "tool_used": "error",
+            "response": str(e),
+            "success": False,
+        }
+
+    return result_record, "\n".join(lines)
+
+
+def _append_result(filename: str, result_record: dict):
+    """Append one result record to a JSONL results file as soon as it's available."""
+    with open(filename, "a") as f:
+        f.write(json.dumps(result_record, separators=(",", ":"), default=str) + "\n")
+
+
+def run_tests(categories=None, verbose=True, save_results=False, max_workers=8):
     """Run test prompts against Clippy.
 
+    Prompts are independent Bedrock round trips, so they run concurrently.
+    Results are printed and recorded in suite order.
+
     Args:
         categories: List of categories to test (None = all)
         verbose: Print full responses
-        save_results: Save results to JSON file
+        save_results: Stream results to a JSONL file as each prompt finishes
+        max_workers: Number of prompts to run concurrently (1 = sequential)
     """
-    from src.mcp_server.slack_bot import invoke_claude_with_tools
-
     metrics = TestMetrics()
     results = []
 
-    for category, prompts in TEST_PROMPTS.items():
-        if categories and category not in categories:
-            continue
-
-        print(f"\n{'='*80}")
-        print(f"CATEGORY: {category.upper()}")
-        print("=" * 80)
-
-        for name, prompt in prompts:
-            print(f"\n[{name}]")
-            print(f"PROMPT: {prompt[:70]}{'...' if len(prompt) > 70 else ''}")
-            print("-" * 60)
-
-            try:
-                result = invoke_claude_with_tools(prompt)
-                tool = result.get("tool_used") or "respond_directly"
-                all_tools = result.get("all_tools_used", [])
-                response = result.get("response", "No response")
-
-                # Check for truncation warning in response
-                was_truncated = "truncated" in response.lower() or result.get("was_truncated")
-                hit_limit = "need more information" in response.lower()
-
-                print(f"TOOL: {tool}")
-                if len(all_tools) > 1:
-                    print(f"ALL TOOLS: {' -> '.join(all_tools)}")
-
-                if was_truncated:
-                    print("WARNING: Results were truncated")
-                if hit_limit:
-                    print("WARNING: Hit max tool call limit")
-
-                if verbose:
-                    print(f"\nRESPONSE:\n{response[:600]}")
-                    if len(response) > 600:
-                        print(f"... [{len(response) - 600} more chars]")
-
-                result_record = {
-                    "category": category,
-                    "name": name,
-                    "prompt": prompt,
-                    "tool_used": tool,
-                    "all_tools_used": all_tools,
-                    "response": response,
-                    "was_truncated": was_truncated,
-                    "hit_tool_limit": hit_limit,
-                    "success": "error" not in response.lower() and "encountered an error" not in response.lower(),
-                }
-
-                results.append(result_record)
-                metrics.record(result_record)
+    jobs = [row for row in _FLAT_PROMPTS if not categories or row[0] in categories]
+    filename = f"test_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl" if save_results else None
 
-            except Exception as e:
-                print(f"ERROR: {e}")
-                import traceback
+    print(f"\nRunning {len(jobs)} prompts ({max_workers} at a time)...")
 
-                traceback.print_exc()
-
-                result_record = {
-                    "category": category,
-                    "name": name,
-                    "prompt": prompt,
-                    "tool_used": "error",
-                    "response": str(e),
-                    "success": False,
-                }
-                results.append(result_record)
-                metrics.record(result_record)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for result_record, output in executor.map(lambda job: _run_prompt(*job, verbose=verbose), jobs):
+            print(output)
+            results.append(result_record)
+            metrics.record(result_record)
+            if filename:
+                _append_result(filename, result_record)
 
     print(metrics.summary())
 
-    if save_results:
-        filename = f"test_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(filename, "w") as f:
-            json.dump(results, f, indent=2)
+    if filename:
         print(f"\nResults saved to {filename}")
 
     return results, metrics
 
 
+def _trim_context(thread_context, budget: int = MAX_THREAD_CONTEXT_CHARS) -> list:
+    """Keep the most recent messages whose combined length fits within the character budget."""
+    kept = []
+    total = 0
+    for msg in reversed(thread_context):
+        total += len(msg)
+        if total > budget:
+            break
+        kept.append(msg)
+    kept.reverse()
+    return kept
+
+
 def run_single_prompt(prompt: str, thread_context: list = None):
     """Test a single prompt with optional thread context."""
     from src.mcp_server.slack_bot import invoke_claude_with_tools
@@ -289,7 +328,7 @@ def interactive_mode():
     print("  /help            - Show this help")
     print("=" * 60 + "\n")
 
-    thread_context = []
+    thread_context = deque(maxlen=MAX_THREAD_CONTEXT)
     session_log = []
     last_response = None
 
@@ -305,24 +344,24 @@ def interactive_mode():
 
         # Handle commands
         if user_input.startswith("/"):
-            cmd = user_input.lower().split()[0]
+            parts = user_input.split()
+            cmd = parts[0].lower()
 
             if cmd in ["/quit", "/q"]:
                 break
             elif cmd in ["/clear", "/c"]:
-                thread_context = []
+                thread_context.clear()
                 print("Thread context cleared.")
                 continue
             elif cmd == "/context":
                 if thread_context:
                     print(f"\nThread context ({len(thread_context)} messages):")
-                    for msg in thread_context[-5:]:
+                    for msg in list(thread_context)[-5:]:
                         print(f"  {msg[:80]}...")
                 else:
                     print("No thread context.")
                 continue
             elif cmd == "/rate":
-                parts = user_input.split()
                 if len(parts) == 2 and parts[1].isdigit():
                     rating = int(parts[1])
                     if 1 <= rating <= 5 and last_response:
@@ -348,7 +387,7 @@ def interactive_mode():
         print("\nClippy: ", end="", flush=True)
 
         try:
-            result = invoke_claude_with_tools(user_input, thread_context=thread_context)
+            result = invoke_claude_with_tools(user_input, thread_context=_trim_context(thread_context))
             response = result.get("response", "No response")
             tool = result.get("tool_used") or "respond_directly"
             all_tools = result.get("all_tools_used", [])
@@ -378,8 +417,6 @@ def interactive_mode():
 
         except Exception as e:
             print(f"Error: {e}")
-            import traceback
-
             traceback.print_exc()
 
     # Offer to save on exit
@@ -394,7 +431,7 @@ def interactive_mode():
 
 def test_follow_up_scenario():
     """Test a multi-turn conversation scenario."""
-    from slack_bot import invoke_claude_with_tools
+    from src.mcp_server.slack_bot import invoke_claude_with_tools
 
     print("\n" + "=" * 60)
     print("FOLLOW-UP SCENARIO TEST")
@@ -408,13 +445,13 @@ def test_follow_up_scenario():
         "Can you check the logs for more details?",
     ]
 
-    thread_context = []
+    thread_context = deque(maxlen=MAX_THREAD_CONTEXT)
 
     for i, prompt in enumerate(conversation):
         print(f"\n--- Turn {i+1} ---")
         print(f"User: {prompt}")
 
-        result = invoke_claude_with_tools(prompt, thread_context=thread_context)
+        result = invoke_claude_with_tools(prompt, thread_context=_trim_context(thread_context))
         response = result.get("response", "No response")
         tool = result.get("tool_used", "none")
 
@@ -435,15 +472,13 @@ def run_tests_with_ecs_config(categories=None, verbose=True, save_results=False,
     Args:
         categories: List of categories to test (None = all)
         verbose: Print full responses
-        save_results: Save results to JSON file
+        save_results: Stream results to a JSONL file as each prompt finishes
         delay_seconds: Delay between tests to avoid rate limiting (default: 3s)
     """
     import time
 
     import requests
 
-    from src.mcp_server.slack_bot import invoke_claude_with_tools
-
     metrics = TestMetrics()
     results = []
 
@@ -474,91 +509,33 @@ def run_tests_with_ecs_config(categories=None, verbose=True, save_results=False,
     except Exception as e:
         print(f"⚠ Could not reach ECS service: {e}")
 
-    total_prompts = sum(len(prompts) for cat, prompts in TEST_PROMPTS.items() if not categories or cat in categories)
-    current = 0
+    jobs = [row for row in _FLAT_PROMPTS if not categories or row[0] in categories]
+    total_prompts = len(jobs)
+    filename = f"test_results_ecs_config_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl" if save_results else None
 
-    for category, prompts in TEST_PROMPTS.items():
-        if categories and category not in categories:
-            continue
+    for current, (category, name, prompt) in enumerate(jobs, start=1):
+        result_record, output = _run_prompt(
+            category, name, prompt, verbose=verbose, label=f"{current}/{total_prompts} {category}"
+        )
+        result_record["ecs_config"] = True
 
-        print(f"\n{'='*80}")
-        print(f"CATEGORY: {category.upper()}")
-        print("=" * 80)
-
-        for name, prompt in prompts:
-            current += 1
-            print(f"\n[{current}/{total_prompts}] {name}")
-            print(f"PROMPT: {prompt[:70]}{'...' if len(prompt) > 70 else ''}")
-            print("-" * 60)
-
-            try:
-                result = invoke_claude_with_tools(prompt)
-                tool = result.get("tool_used") or "respond_directly"
-                all_tools = result.get("all_tools_used", [])
-                response = result.get("response", "No response")
-
-                was_truncated = "truncated" in response.lower() or result.get("was_truncated")
-                hit_limit = "need more information" in response.lower()
-
-                print(f"TOOL: {tool}")
-                if len(all_tools) > 1:
-                    print(f"ALL TOOLS: {' -> '.join(all_tools)}")
-
-                if was_truncated:
-                    print("WARNING: Results were truncated")
-                if hit_limit:
-                    print("WARNING: Hit max tool call limit")
-
-                if verbose:
-                    print(f"\nRESPONSE:\n{response[:600]}")
-                    if len(response) > 600:
-                        print(f"... [{len(response) - 600} more chars]")
-
-                result_record = {
-                    "category": category,
-                    "name": name,
-                    "prompt": prompt,
-                    "tool_used": tool,
-                    "all_tools_used": all_tools,
-                    "response": response,
-                    "was_truncated": was_truncated,
-                    "hit_tool_limit": hit_limit,
-                    "success": "error" not in response.lower() and "encountered an error" not in response.lower(),
-                    "ecs_config": True,
-                }
-
-                results.append(result_record)
-                metrics.record(result_record)
-
-            except Exception as e:
-                print(f"ERROR: {e}")
-                import traceback
+        # Rate limit protection - delay between tests
+        wait = delay_seconds > 0 and current < total_prompts
+        if wait:
+            output += f"\n  (waiting {delay_seconds}s to avoid rate limits...)"
+        print(output)
 
-                traceback.print_exc()
-
-                result_record = {
-                    "category": category,
-                    "name": name,
-                    "prompt": prompt,
-                    "tool_used": "error",
-                    "response": str(e),
-                    "success": False,
-                    "ecs_config": True,
-                }
-                results.append(result_record)
-                metrics.record(result_record)
+        results.append(result_record)
+        metrics.record(result_record)
+        if filename:
+            _append_result(filename, result_record)
 
-            # Rate limit protection - delay between tests
-            if delay_seconds > 0 and current < total_prompts:
-                print(f"  (waiting {delay_seconds}s to avoid rate limits...)")
-                time.sleep(delay_seconds)
+        if wait:
+            time.sleep(delay_seconds)
 
     print(metrics.summary())
 
-    if save_results:
-        filename = f"test_results_ecs_config_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(filename, "w") as f:
-            json.dump(results, f, indent=2)
+    if filename:
         print(f"\nResults saved to {filename}")
 
     return results, metrics
@@ -573,9 +550,10 @@ if __name__ == "__main__":
     parser.add_argument("--quiet", "-q", action="store_true", help="Less verbose output")
     parser.add_argument("--list", "-l", action="store_true", help="List all prompts")
     parser.add_argument("--interactive", "-i", action="store_true", help="Interactive mode")
-    parser.add_argument("--save", "-s", action="store_true", help="Save results to JSON")
+    parser.add_argument("--save", "-s", action="store_true", help="Save results to JSONL")
     parser.add_argument("--followup", "-f", action="store_true", help="Test follow-up scenario")
     parser.add_argument("--remote", "-r", action="store_true", help="Test with ECS config (Secrets Manager)")
+    parser.add_argument("--workers", "-w", type=int, default=8, help="Prompts to run concurrently (default: 8)")
 
     args = parser.parse_args()
 
@@ -598,4 +576,4 @@ if __name__ == "__main__":
         run_tests_with_ecs_config(categories=categories, verbose=not args.quiet, save_results=args.save)
     else:
         categories = [args.category] if args.category else None
-        run_tests(categories=categories, verbose=not args.quiet, save_results=args.save)
+        run_tests(categories=categories, verbose=not args.quiet, save_results=args.save, max_workers=args.workers)
@@ -0,0 +1,118 @@
+"""Tests for the Clippy tool result cache in tool_executor.
+
+Run with: python tests/test_tool_cache.py
+
+Tool execution is stubbed, so no backend access is needed. Tests cover:
+1. Only allow-listed (slow-changing) tools are cached
+2. TTL expiry
+3. Eviction of the oldest entry when the cache is full
+4. Error results are never cached
+5. Cached results are isolated from caller mutation
+"""
+
+import os
+import sys
+from unittest import mock
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.mcp_server.slack_bot import tool_executor
+
+
+class _StubBackend:
+    """Stand-in for _execute_tool_internal that counts calls and returns a fixed result."""
+
+    def __init__(self, result=None):
+        self.calls = 0
+        self.result = result if result is not None else {"title": "Runbook", "items": [1, 2]}
+
+    def __call__(self, tool_name, tool_input):
+        self.calls += 1
+        return dict(self.result, items=list(self.result.get("items", [])))
+
+
+def _run(backend, calls):
+    """Run (tool_name, tool_input) calls against a fresh cache with the backend stubbed."""
+    tool_executor._result_cache.clear()
+    with mock.patch.object(tool_executor, "_execute_tool_internal", backend):
+        return [tool_executor.execute_tool(name, tool_input) for name, tool_input in calls]
+
+
+def _check(name: str, ok: bool, detail: str = "") -> tuple[int, int]:
+    if ok:
+        print(f"  ✅ {name}")
+        return 1, 0
+    print(f"  ❌ {name} {detail}")
+    return 0, 1
+
+
+def test_tool_cache():
+    """Test caching rules for tool results."""
+    print("\n" + "=" * 60)
+    print("TOOL RESULT CACHE TESTS")
+    print("=" * 60)
+
+    results = []
+
+    # Allow-listed lookup: the second identical call is served from cache
+    backend = _StubBackend()
+    _run(backend, [("get_confluence_page", {"page_id": "1"})] * 2)
+    results.append(_check("allow-listed tool cached", backend.calls == 1, f"(calls={backend.calls})"))
+
+    # Live-state tool: always hits the backend
+    backend = _StubBackend()
+    _run(backend, [("pagerduty_active_incidents", {})] * 2)
+    results.append(_check("live-state tool not cached", backend.calls == 2, f"(calls={backend.calls})"))
+
+    # TTL expiry: an entry past its TTL is refetched
+    backend = _StubBackend()
+    clock = [0.0]
+    with mock.patch.object(tool_executor.time, "monotonic", lambda: clock[0]):
+        _run(backend, [("get_confluence_page", {"page_id": "1"})])
+        clock[0] += tool_executor._RESULT_CACHE_TTL_SECONDS + 1
+        with mock.patch.object(tool_executor, "_execute_tool_internal", backend):
+            tool_executor.execute_tool("get_confluence_page", {"page_id": "1"})
+    results.append(_check("expired entry refetched", backend.calls == 2, f"(calls={backend.calls})"))
+
+    # Eviction: once full, the oldest entry is dropped to make room
+    backend = _StubBackend()
+    with mock.patch.object(tool_executor, "_RESULT_CACHE_MAX_ENTRIES", 2):
+        _run(
+            backend,
+            [
+                ("get_confluence_page", {"page_id": "1"}),
+                ("get_confluence_page", {"page_id": "2"}),
+                ("get_confluence_page", {"page_id": "3"}),  # Evicts page 1
+                ("get_confluence_page", {"page_id": "3"}),  # Cache hit
+                ("get_confluence_page", {"page_id": "1"}),  # Refetched
+            ],
+        )
+    results.append(_check("oldest entry evicted", backend.calls == 4, f"(calls={backend.calls})"))
+
+    # Errors are never cached
+    backend = _StubBackend({"error": "Confluence API timeout"})
+    _run(backend, [("get_confluence_page", {"page_id": "1"})] * 2)
+    results.append(_check("error result not cached", backend.calls == 2, f"(calls={backend.calls})"))
+
+    # Mutating a returned result must not leak into later cache hits
+    backend = _StubBackend()
+    (first,) = _run(backend, [("get_confluence_page", {"page_id": "1"})])
+    first["items"].append(3)  # Mutate the result that was stored
+    second = tool_executor.execute_tool("get_confluence_page", {"page_id": "1"})
+    second["title"] = "changed"  # Mutate a cache hit
+    third = tool_executor.execute_tool("get_confluence_page", {"page_id": "1"})
+    ok = backend.calls == 1 and third == backend.result
+    results.append(_check("cached results isolated from callers", ok, f"(got {third})"))
+
+    tool_executor._result_cache.clear()
+
+    passed = sum(p for p, _ in results)
+    failed = sum(f for _, f in results)
+    print(f"\nTool Cache: {passed}/{passed + failed} passed")
+    return passed, failed
+
+
+if __name__ == "__main__":
+    _, failed = test_tool_cache()
+    exit(1 if failed else 0)